@@ -1,33 +1,218 @@
 import os
 import json
+import pickle
+import hashlib
 import argparse
 import pandas as pd
+import openpyxl
+from dataclasses import dataclass, field, asdict
 from datetime import datetime
+from typing import Optional, Union
 import re
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:  # pyarrow is optional; CSVs fall back to pandas' writer
+    pa = None
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; metadata falls back to the stdlib json module
+    orjson = None
+
 # Constants
 ETL_VERSION = "v1.0.0"
 DEFAULT_INPUT_DIR = "inputs"
 DEFAULT_OUTPUT_DIR = "runs"
-DEFAULT_METADATA = {
-    "created_by_etl_version": ETL_VERSION,
-    "block_type": "Unknown",
-    "chemistry": "Not specified",
-    "passive_reference": "None",
-    "date_created": None,
-    "experiment_type": "Unknown",
-    "quantification_cycle_method": "Standard",
-    "signal_smoothing_on": False,
-    "experiment_run_end_time": None,
-    #"calibration": {},
-    #"num_wells": 0,
-    #"targets_detected": [],
-    #"num_amplification_cycles": 0,
-    "samples": []
+CACHE_DIR_NAME = ".cache"  # Pickled sheet frames, stored under the base output directory
+CACHE_VERSION = 2  # Bump whenever sheet parsing changes so stale pickled frames are not reused
+SAMPLE_SETUP_HEADER_ROWS = 35  # Rows above the extended Sample Setup table
+_TZ_RE = re.compile(r"\b(?:AM|PM|EDT|PST|CST|EST|UTC)\b", re.IGNORECASE)  # AM/PM and timezone suffixes
+_WELL_RE = re.compile(r"^([A-Z]+)(\d+)", re.IGNORECASE)  # Well position, e.g. "A12" -> ("A", "12")
+CATEGORICAL_COLUMNS = ["Well", "Well Position", "Target Name"]  # Low-cardinality per-well labels
+_WB_CACHE = {}  # (absolute path, mtime_ns) -> {frame name: DataFrame}, reused within a process
+# Measurements are stored as float32; downstream means/stds/plots do not need double precision
+COLUMN_DTYPES = {
+    "Temperature": "float32",
+    "Fluorescence": "float32",
+    "Derivative": "float32",
+    "Rn": "float32",
+    "Delta Rn": "float32"
 }
 
+
+# Metadata Model
+@dataclass(slots=True)
+class RunMetadata:
+    '''
+    Run-level metadata written to metadata.json, with default fallbacks for missing fields.
+    '''
+    created_by_etl_version: str = ETL_VERSION
+    block_type: str = "Unknown"
+    chemistry: str = "Not specified"
+    passive_reference: str = "None"
+    date_created: Optional[str] = None
+    experiment_type: str = "Unknown"
+    quantification_cycle_method: str = "Standard"
+    signal_smoothing_on: Union[bool, str] = False
+    experiment_run_end_time: Optional[str] = None
+    #calibration: dict = field(default_factory=dict)
+    #num_wells: int = 0
+    #targets_detected: list = field(default_factory=list)
+    #num_amplification_cycles: int = 0
+    samples: list = field(default_factory=list)
+    replicates: dict = field(default_factory=dict)
+    summary: Optional[dict] = None
+
+    def to_dict(self) -> dict:
+        '''
+        Returns the metadata as a plain dictionary, omitting the summary when it was not computed.
+
+        Returns:
+            dict: JSON-serializable metadata fields.
+        '''
+        data = asdict(self)
+        if data["summary"] is None:
+            del data["summary"]
+        return data
+
+
+# Sheet Streaming
+def dedup_columns(columns: list) -> list:
+    '''
+    Renames repeated column labels the way pandas' Excel reader does ("X", "X.1", "X.2", ...).
+
+    Args:
+        columns (list): Header labels in sheet order.
+
+    Returns:
+        list: Header labels with duplicates suffixed.
+    '''
+    original = set(columns)
+    counts = {}
+    deduped = []
+    for col in columns:
+        base = col
+        count = counts.get(col, 0)
+        while count > 0:
+            counts[base] = count + 1
+            col = f"{base}.{count}"
+            # Skip suffixes that already appear as labels elsewhere in the header
+            count = count + 1 if col in original else counts.get(col, 0)
+        counts[col] = count + 1
+        deduped.append(col)
+    return deduped
+
+
+def rows_to_dataframe(rows, expected_columns: list = None, sheet_name: str = "") -> pd.DataFrame:
+    '''
+    Builds a DataFrame from streamed worksheet rows, using the first non-empty row as the header.
+
+    Args:
+        rows (Iterable[tuple]): Cell values as yielded by openpyxl's iter_rows(values_only=True).
+        expected_columns (list, optional): Columns that must be present in the header row.
+        sheet_name (str, optional): Sheet name used in validation error messages.
+
+    Returns:
+        pd.DataFrame: DataFrame with blank rows dropped and known numeric columns typed.
+
+    Raises:
+        ValueError: If any of the expected columns are missing from the header row.
+    '''
+    rows = iter(rows)
+    header = next((row for row in rows if any(cell is not None for cell in row)), ())
+    columns = [cell if cell is not None else f"Unnamed: {i}" for i, cell in enumerate(header)]
+
+    # Validate the header before iterating the (potentially large) body of the sheet
+    missing_cols = [col for col in (expected_columns or []) if col not in columns]
+    if missing_cols:
+        raise ValueError(f"Missing expected columns in {sheet_name}: {missing_cols}")
+
+    records = [row for row in rows if any(cell is not None for cell in row)]
+
+    # Trim trailing columns that are empty in every row (formatted-but-empty cells stream as None).
+    # Each row is only scanned backwards until it reaches the widest populated column found so far.
+    width = 0
+    for row in [header, *records]:
+        for i in range(len(row), width, -1):
+            if row[i - 1] is not None:
+                width = i
+                break
+    columns = dedup_columns((columns + [f"Unnamed: {i}" for i in range(len(columns), width)])[:width])
+
+    # Rows can be ragged once sheet dimensions are reset; only rebuild rows that are not already `width` wide
+    records = [row if len(row) == width else row[:width] + (None,) * (width - len(row)) for row in records]
+
+    df = pd.DataFrame.from_records(records, columns=columns)
+
+    # Non-numeric measurement cells (e.g. "N/A") become NaN rather than failing the whole load
+    for col, dtype in COLUMN_DTYPES.items():
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], errors="coerce").astype(dtype)
+    return df
+
+
+def read_sheet(sheets: dict, sheet_name: str, skiprows: int = 0, expected_columns: list = None) -> pd.DataFrame:
+    '''
+    Streams a single worksheet into a DataFrame in one pass.
+
+    Args:
+        sheets (dict): Worksheets of a read-only workbook, keyed by sheet name.
+        sheet_name (str): Name of the sheet to read.
+        skiprows (int, optional): Number of leading rows to skip before the header.
+        expected_columns (list, optional): Columns that must be present in the header row.
+
+    Returns:
+        pd.DataFrame: DataFrame built from the sheet rows.
+    '''
+    ws = sheets[sheet_name]
+    ws.reset_dimensions()  # The stored <dimension> tag can be wrong; read every row actually present
+    rows = ws.iter_rows(min_row=skiprows + 1, values_only=True)
+    return rows_to_dataframe(rows, expected_columns, sheet_name)
+
+
+def write_csv(df: pd.DataFrame, path: str):
+    '''
+    Writes a DataFrame to CSV, using pyarrow's multithreaded writer when available.
+
+    Args:
+        df (pd.DataFrame): DataFrame to be written.
+        path (str): Destination CSV file path.
+    '''
+    if pa is not None:
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            pa_csv.write_csv(table, path)
+            return
+        except (pa.ArrowException, ValueError, TypeError):
+            # Frames Arrow cannot convert (mixed-type object columns such as numeric CT values alongside
+            # "Undetermined", duplicate column names, ...) are written by pandas instead
+            pass
+    df.to_csv(path, index=False, lineterminator="\n", chunksize=65536, date_format="%Y-%m-%d %H:%M:%S")
+
+
+def write_parquet(df: pd.DataFrame, path: str):
+    '''
+    Writes a zstd-compressed Parquet copy of a DataFrame so later analyses can skip CSV parsing.
+
+    Args:
+        df (pd.DataFrame): DataFrame to be written.
+        path (str): Destination Parquet file path.
+    '''
+    if pa is None:
+        print(f"[WARN] pyarrow not installed, skipping Parquet output: {path}")
+        return
+
+    try:
+        df.to_parquet(path, engine="pyarrow", compression="zstd", index=False)
+        print(f"[INFO] Parquet copy saved to {path}")
+    except Exception as e:
+        print(f"[WARN] Failed to save Parquet copy {path}: {e}")
+
+
 # Metadata Extraction
-def extract_metadata(df: pd.DataFrame) -> dict:
+def extract_metadata(df: pd.DataFrame) -> RunMetadata:
     '''
     Extracts metadata from the Sample Setup DataFrame.
 
@@ -35,40 +220,43 @@ def extract_metadata(df: pd.DataFrame) -> dict:
         df (pd.DataFrame): DataFrame parsed from the 'Sample Setup' Excel sheet.
 
     Returns:
-        dict: A dictionary containing extracted metadata fields with default fallbacks.
+        RunMetadata: Extracted metadata fields with default fallbacks.
     '''
-    metadata = DEFAULT_METADATA.copy()
+    metadata = RunMetadata()
 
     try:
         # Extract block type from the second column header
-        metadata["block_type"] = df.columns[1] if df.shape[1] > 1 else metadata["block_type"]
+        metadata.block_type = df.columns[1] if df.shape[1] > 1 else metadata.block_type
 
-        flat_dict = dict(zip(df.iloc[:, 0].astype(str).str.strip(), df.iloc[:, 1]))
+        # Zip the raw object arrays rather than building intermediate Series; blank keys are skipped
+        keys = df.iloc[:, 0].to_numpy(dtype=object)
+        values = df.iloc[:, 1].to_numpy(dtype=object)
+        flat_dict = {str(k).strip(): v for k, v in zip(keys, values) if k is not None and k == k}
 
-        metadata["chemistry"] = flat_dict.get("Chemistry", metadata["chemistry"])
-        metadata["passive_reference"] = flat_dict.get("Passive Reference", metadata["passive_reference"])
-        date_created_raw = flat_dict.get("Date Created", metadata["date_created"])
+        metadata.chemistry = flat_dict.get("Chemistry", metadata.chemistry)
+        metadata.passive_reference = flat_dict.get("Passive Reference", metadata.passive_reference)
+        date_created_raw = flat_dict.get("Date Created", metadata.date_created)
         if date_created_raw:
-            date_created_clean = re.sub(r"\b(AM|PM|EDT|PST|CST|EST|UTC)\b", "", date_created_raw, flags=re.IGNORECASE).strip()
-            metadata["date_created"] = date_created_clean
+            date_created_clean = _TZ_RE.sub("", date_created_raw).strip()
+            metadata.date_created = date_created_clean
         else:
-            metadata["date_created"] = metadata["date_created"]
-        metadata["experiment_type"] = flat_dict.get("Experiment Type", metadata["experiment_type"])
-        metadata["quantification_cycle_method"] = flat_dict.get("Quantification Cycle Method", metadata["quantification_cycle_method"])
-        metadata["signal_smoothing_on"] = flat_dict.get("Signal Smoothing On", metadata["signal_smoothing_on"])
+            metadata.date_created = metadata.date_created
+        metadata.experiment_type = flat_dict.get("Experiment Type", metadata.experiment_type)
+        metadata.quantification_cycle_method = flat_dict.get("Quantification Cycle Method", metadata.quantification_cycle_method)
+        metadata.signal_smoothing_on = flat_dict.get("Signal Smoothing On", metadata.signal_smoothing_on)
 
         # Experiment Run End Time (used for folder naming)
         run_time_str = flat_dict.get("Experiment Run End Time")
         if run_time_str:
             try:
                 # Remove any unrecognized timezone abbreviations like 'EDT', 'PST', and AM/PM indicators
-                run_time_str = re.sub(r"\b(AM|PM|EDT|PST|CST|EST|UTC)\b", "", run_time_str, flags=re.IGNORECASE).strip()
+                run_time_str = _TZ_RE.sub("", run_time_str).strip()
                 run_time = pd.to_datetime(run_time_str)
-                metadata["experiment_run_end_time"] = run_time.strftime("%Y-%m-%d %H:%M:%S")
+                metadata.experiment_run_end_time = run_time.strftime("%Y-%m-%d %H:%M:%S")
             except Exception:
-                metadata["experiment_run_end_time"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                metadata.experiment_run_end_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         else:
-            metadata["experiment_run_end_time"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            metadata.experiment_run_end_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
     except Exception as e:
         print(f"[WARN] Failed to extract metadata from Sample Setup: {e}")
@@ -93,29 +281,34 @@ def create_output_dir(run_time: str, base_output: str) -> str:
     return output_path
 
 
-def save_metadata(metadata: dict, output_path: str):
+def save_metadata(metadata: RunMetadata, output_path: str):
     '''
-    Saves metadata dictionary as a JSON file in the specified output directory.
+    Saves run metadata as a JSON file in the specified output directory.
 
     Args:
-        metadata (dict): Metadata to be saved.
+        metadata (RunMetadata): Metadata to be saved.
         output_path (str): Directory where the metadata file will be written.
     '''
     try:
         metadata_path = os.path.join(output_path, "metadata.json")
-        with open(metadata_path, "w") as f:
-            json.dump(metadata, f, indent=4)
+        data = metadata.to_dict()
+        if orjson is not None:
+            with open(metadata_path, "wb") as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        else:
+            with open(metadata_path, "w") as f:
+                json.dump(data, f, indent=2)
         print(f"[INFO] Metadata saved to {metadata_path}")
     except Exception as e:
         print(f"[ERROR] Failed to save metadata: {e}")
 
 
-def load_melt_curve_data(xls: pd.ExcelFile) -> pd.DataFrame:
+def load_melt_curve_data(sheets: dict) -> pd.DataFrame:
     '''
     Loads and validates the 'Melt Curve Raw Data' sheet from the Excel file.
 
     Args:
-        xls (pd.ExcelFile): Parsed Excel file object.
+        sheets (dict): Worksheets of a read-only workbook, keyed by sheet name.
 
     Returns:
         pd.DataFrame: Cleaned DataFrame containing melt curve measurements.
@@ -123,28 +316,26 @@ def load_melt_curve_data(xls: pd.ExcelFile) -> pd.DataFrame:
     Raises:
         ValueError: If required columns are missing or the sheet is not found.
     '''
-    if "Melt Curve Raw Data" not in xls.sheet_names:
+    if "Melt Curve Raw Data" not in sheets:
         raise ValueError("'Melt Curve Raw Data' sheet not found.")
 
-    df = xls.parse("Melt Curve Raw Data")
     expected_columns = [
         "Well", "Well Position", "Reading", "Temperature",
         "Fluorescence", "Derivative", "Target Name"
     ]
 
-    missing_cols = [col for col in expected_columns if col not in df.columns]
-    if missing_cols:
-        raise ValueError(f"Missing expected columns in Melt Curve Raw Data: {missing_cols}")
+    df = read_sheet(sheets, "Melt Curve Raw Data", expected_columns=expected_columns)
+    df[CATEGORICAL_COLUMNS] = df[CATEGORICAL_COLUMNS].astype("category")
 
     return df
 
 
-def load_amplification_data(xls: pd.ExcelFile) -> pd.DataFrame:
+def load_amplification_data(sheets: dict) -> pd.DataFrame:
     '''
     Loads and validates the 'Amplification Data' sheet from the Excel file.
 
     Args:
-        xls (pd.ExcelFile): Parsed Excel file object.
+        sheets (dict): Worksheets of a read-only workbook, keyed by sheet name.
 
     Returns:
         pd.DataFrame: Cleaned DataFrame containing amplification measurements.
@@ -152,46 +343,126 @@ def load_amplification_data(xls: pd.ExcelFile) -> pd.DataFrame:
     Raises:
         ValueError: If required columns are missing or the sheet is not found.
     '''
-    if "Amplification Data" not in xls.sheet_names:
+    if "Amplification Data" not in sheets:
         raise ValueError("'Amplification Data' sheet not found.")
 
-    df = xls.parse("Amplification Data")
     expected_columns = [
         "Well", "Well Position", "Cycle", "Target Name",
         "Rn", "Delta Rn"
     ]
 
-    missing_cols = [col for col in expected_columns if col not in df.columns]
-    if missing_cols:
-        raise ValueError(f"Missing expected columns in Amplification Data: {missing_cols}")
+    df = read_sheet(sheets, "Amplification Data", expected_columns=expected_columns)
 
     # Drop rows with missing well or measurement data
     df.dropna(subset=["Well", "Rn", "Delta Rn"], inplace=True)
+    df[CATEGORICAL_COLUMNS] = df[CATEGORICAL_COLUMNS].astype("category")
 
     return df
 
 
 # Load Results Data
-def load_results_data(xls: pd.ExcelFile) -> pd.DataFrame:
+def load_results_data(sheets: dict) -> pd.DataFrame:
     '''
     Loads and returns the results table from the 'Results' sheet starting around row 35.
 
     Args:
-        xls (pd.ExcelFile): Excel file object.
+        sheets (dict): Worksheets of a read-only workbook, keyed by sheet name.
 
     Returns:
         pd.DataFrame: Cleaned results DataFrame.
     '''
-    if "Results" not in xls.sheet_names:
+    if "Results" not in sheets:
         raise ValueError("'Results' sheet not found.")
 
-    df = xls.parse("Results", skiprows=35)
+    df = read_sheet(sheets, "Results", skiprows=35)
     df = df.dropna(how="all")  # Drop fully empty rows
     return df
 
 
+# Workbook Cache
+def load_workbook_frames(input_file: str, output_dir: str, need: str = "all", persist: bool = True) -> dict:
+    '''
+    Returns the parsed sheet DataFrames for a workbook, reusing cached copies when the file is unchanged.
+
+    Frames are cached in-process and pickled under `<output_dir>/.cache/`, keyed on the file's
+    absolute path, modification time, CACHE_VERSION, and the ETL version. Only sheets that are
+    requested but not yet cached are streamed from the workbook. Callers receive copies, so the
+    cached frames are never mutated.
+
+    Args:
+        input_file (str): Path to the input Excel file.
+        output_dir (str): Base output directory holding the cache folder.
+        need (str, optional): Which data sheets to load: "melt", "amp", "results", or "all".
+        persist (bool, optional): If True, writes newly parsed frames to the on-disk cache.
+
+    Returns:
+        dict: DataFrames keyed by "setup", "setup_extended", and the requested "melt", "amp", "results".
+    '''
+    key = (os.path.abspath(input_file), os.stat(input_file).st_mtime_ns)
+    path_digest = hashlib.sha1(key[0].encode()).hexdigest()[:16]
+    version_digest = hashlib.sha1(repr((CACHE_VERSION, ETL_VERSION, key[1])).encode()).hexdigest()[:16]
+    cache_dir = os.path.join(output_dir, CACHE_DIR_NAME)
+    cache_path = os.path.join(cache_dir, f"{path_digest}_{version_digest}.pkl")
+
+    frames = _WB_CACHE.get(key)
+    if frames is None:
+        frames = {}
+        if os.path.isfile(cache_path):
+            try:
+                with open(cache_path, "rb") as f:
+                    frames = pickle.load(f)
+            except Exception as e:
+                print(f"[WARN] Ignoring unreadable workbook cache {cache_path}: {e}")
+        _WB_CACHE[key] = frames
+
+    sheet_loaders = {
+        "melt": load_melt_curve_data,
+        "amp": load_amplification_data,
+        "results": load_results_data
+    }
+    wanted = list(sheet_loaders) if need == "all" else [need]
+    missing = [name for name in ["setup", *wanted] if name not in frames]
+    if not missing:
+        return {name: frames[name].copy() for name in ["setup", "setup_extended", *wanted]}
+
+    # Open the workbook once in read-only mode; only the missing sheets are streamed
+    wb = openpyxl.load_workbook(input_file, read_only=True, data_only=True)
+    try:
+        sheets = {ws.title: ws for ws in wb.worksheets}
+        if "setup" in missing:
+            if "Sample Setup" not in sheets:
+                raise ValueError("'Sample Setup' sheet not found.")
+
+            # Split the Sample Setup sheet into the metadata header and the extended sample table
+            sheets["Sample Setup"].reset_dimensions()
+            setup_rows = list(sheets["Sample Setup"].iter_rows(values_only=True))
+            frames["setup"] = rows_to_dataframe(setup_rows[:SAMPLE_SETUP_HEADER_ROWS])
+            frames["setup_extended"] = rows_to_dataframe(setup_rows[SAMPLE_SETUP_HEADER_ROWS:])
+
+        for name in missing:
+            if name in sheet_loaders:
+                frames[name] = sheet_loaders[name](sheets)
+    finally:
+        wb.close()
+
+    if persist:
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            with open(cache_path, "wb") as f:
+                pickle.dump(frames, f, protocol=5)
+
+            # Evict stale pickles of the same input (older mtimes or cache versions)
+            for name in os.listdir(cache_dir):
+                if name.startswith(f"{path_digest}_") and name != os.path.basename(cache_path):
+                    os.remove(os.path.join(cache_dir, name))
+        except Exception as e:
+            print(f"[WARN] Failed to write workbook cache {cache_path}: {e}")
+
+    return {name: frames[name].copy() for name in ["setup", "setup_extended", *wanted]}
+
+
 # Main ETL
-def main(input_file: str, output_dir: str, verbose: bool = False, dry_run: bool = False, skip_metadata: bool = False, skip_summary: bool = False):
+def main(input_file: str, output_dir: str, verbose: bool = False, dry_run: bool = False, skip_metadata: bool = False, skip_summary: bool = False, need: str = "all"):
     '''
     Main entry point for the ETL pipeline.
 
@@ -201,38 +472,33 @@ def main(input_file: str, output_dir: str, verbose: bool = False, dry_run: bool
         verbose (bool, optional): If True, prints debug info to console.
         dry_run (bool, optional): If True, processes data without saving outputs.
         skip_metadata (bool, optional): If True, skips saving metadata.json.
+        skip_summary (bool, optional): If True, skips adding summary stats to metadata.json.
+        need (str, optional): Which data sheets to load: "melt", "amp", "results", or "all".
     '''
     try:
         if not os.path.isfile(input_file):
             raise FileNotFoundError(f"Input file not found: {input_file}")
 
-        xls = pd.ExcelFile(input_file)
-        if "Sample Setup" not in xls.sheet_names:
-            raise ValueError("'Sample Setup' sheet not found.")
-
-        setup_df = xls.parse("Sample Setup")
+        frames = load_workbook_frames(input_file, output_dir, need=need, persist=not dry_run)
+        setup_df = frames["setup"]
         metadata = extract_metadata(setup_df)
 
         # Load additional sample name info from extended Sample Setup table
         try:
-            sample_setup_extended = xls.parse("Sample Setup", skiprows=35)
+            sample_setup_extended = frames["setup_extended"]
             if "Sample Name" in sample_setup_extended.columns and "Well Position" in sample_setup_extended.columns:
                 # Store sample names
                 unique_sample_names = sample_setup_extended["Sample Name"].dropna().unique().tolist()
-                metadata["samples"] = unique_sample_names
+                metadata.samples = unique_sample_names
 
                 # Build replicate groupings
-                replicate_map = {}
-                for _, row in sample_setup_extended.dropna(subset=["Sample Name", "Well Position"]).iterrows():
-                    sample = row["Sample Name"]
-                    well = row["Well Position"]
-                    match = re.match(r"([A-Z]+)(\d+)", str(well).strip(), re.IGNORECASE)
-                    if match:
-                        row_num = match.group(2)
-                        group_key = f"{sample}_{row_num}"
-                        replicate_map.setdefault(group_key, []).append(well)
-
-                metadata["replicates"] = replicate_map
+                samples_df = sample_setup_extended.dropna(subset=["Sample Name", "Well Position"]).copy()
+                samples_df["row_num"] = samples_df["Well Position"].astype(str).str.strip().str.extract(_WELL_RE)[1]
+                samples_df = samples_df.dropna(subset=["row_num"])
+                grouped = samples_df.groupby([samples_df["Sample Name"].astype(str), "row_num"], sort=False)["Well Position"].agg(list)
+                replicate_map = {f"{sample}_{row_num}": wells for (sample, row_num), wells in grouped.items()}
+
+                metadata.replicates = replicate_map
 
                 if verbose:
                     print(f"[INFO] Found {len(unique_sample_names)} unique sample names.")
@@ -240,58 +506,73 @@ def main(input_file: str, output_dir: str, verbose: bool = False, dry_run: bool
 
         except Exception as e:
             print(f"[WARN] Could not extract sample names from extended Sample Setup: {e}")
-        run_output_dir = create_output_dir(metadata["experiment_run_end_time"], output_dir)
+        run_output_dir = create_output_dir(metadata.experiment_run_end_time, output_dir)
 
-        melt_df = load_melt_curve_data(xls)
-        amp_df = load_amplification_data(xls)
-        results_df = load_results_data(xls)
+        melt_df = frames.get("melt") if need in ("melt", "all") else None
+        amp_df = frames.get("amp") if need in ("amp", "all") else None
+        results_df = frames.get("results") if need in ("results", "all") else None
 
         if not skip_summary:
-            metadata["summary"] = {
-                "melt_curve": {
+            metadata.summary = {}
+            if melt_df is not None:
+                metadata.summary["melt_curve"] = {
                     "num_wells": melt_df['Well'].nunique(),
-                    "temperature_range": [melt_df['Temperature'].min(), melt_df['Temperature'].max()],
+                    "temperature_range": [float(melt_df['Temperature'].min()), float(melt_df['Temperature'].max())],
                     "unique_targets": melt_df['Target Name'].dropna().unique().tolist()
-                },
-                "amplification": {
-                    "num_cycles": amp_df['Cycle'].max() if not amp_df.empty else 0,
+                }
+            if amp_df is not None:
+                metadata.summary["amplification"] = {
+                    "num_cycles": int(amp_df['Cycle'].max()) if not amp_df.empty else 0,
                     "num_amplified_wells": amp_df['Well'].nunique(),
                     "unique_targets": amp_df['Target Name'].dropna().unique().tolist()
                 }
-            }
 
-        # Melt Curve Sheet
         if not skip_metadata and not dry_run:
+            # A partial --need run keeps the summary sections written by earlier runs into this directory
+            existing_path = os.path.join(run_output_dir, "metadata.json")
+            if need != "all" and metadata.summary is not None and os.path.isfile(existing_path):
+                try:
+                    with open(existing_path) as f:
+                        previous_summary = json.load(f).get("summary") or {}
+                    metadata.summary = {**previous_summary, **metadata.summary}
+                except Exception as e:
+                    print(f"[WARN] Could not merge existing summary from {existing_path}: {e}")
             save_metadata(metadata, run_output_dir)
 
-        if verbose:
-            print(f"[INFO] Loaded Melt Curve Raw Data with shape: {melt_df.shape}")
-            print(melt_df.head())
+        # Melt Curve Sheet
+        if melt_df is not None:
+            if verbose:
+                print(f"[INFO] Loaded Melt Curve Raw Data with shape: {melt_df.shape}")
+                print(melt_df.head())
 
-        if not dry_run:
-            melt_output_path = os.path.join(run_output_dir, "melt_curve_data.csv")
-            melt_df.to_csv(melt_output_path, index=False)
-            print(f"[INFO] Melt Curve data saved to {melt_output_path}")
+            if not dry_run:
+                melt_output_path = os.path.join(run_output_dir, "melt_curve_data.csv")
+                write_csv(melt_df, melt_output_path)
+                print(f"[INFO] Melt Curve data saved to {melt_output_path}")
+                write_parquet(melt_df, melt_output_path.replace(".csv", ".parquet"))
 
         # Amplification Sheet
-        if verbose:
-            print(f"[INFO] Loaded Amplification Data with shape: {amp_df.shape}")
-            print(amp_df.head())
+        if amp_df is not None:
+            if verbose:
+                print(f"[INFO] Loaded Amplification Data with shape: {amp_df.shape}")
+                print(amp_df.head())
 
-        if not dry_run:
-            amp_output_path = os.path.join(run_output_dir, "amplification_data.csv")
-            amp_df.to_csv(amp_output_path, index=False)
-            print(f"[INFO] Amplification data saved to {amp_output_path}")
+            if not dry_run:
+                amp_output_path = os.path.join(run_output_dir, "amplification_data.csv")
+                write_csv(amp_df, amp_output_path)
+                print(f"[INFO] Amplification data saved to {amp_output_path}")
+                write_parquet(amp_df, amp_output_path.replace(".csv", ".parquet"))
 
         # Results Sheet
-        if verbose:
-            print(f"[INFO] Loaded Results Data with shape: {results_df.shape}")
-            #print(results_df.info())
+        if results_df is not None:
+            if verbose:
+                print(f"[INFO] Loaded Results Data with shape: {results_df.shape}")
+                #print(results_df.info())
 
-        if not dry_run:
-            results_output_path = os.path.join(run_output_dir, "results_table.csv")
-            results_df.to_csv(results_output_path, index=False)
-            print(f"[INFO] Results data saved to {results_output_path}")
+            if not dry_run:
+                results_output_path = os.path.join(run_output_dir, "results_table.csv")
+                write_csv(results_df, results_output_path)
+                print(f"[INFO] Results data saved to {results_output_path}")
 
         print(f"[INFO] Run directory initialized at: {run_output_dir}")
     except Exception as e:
@@ -308,6 +589,7 @@ if __name__ == "__main__":
     parser.add_argument("--dry-run", action="store_true", help="Run without saving any output")
     parser.add_argument("--skip-metadata", action="store_true", help="Skip saving metadata.json")
     parser.add_argument("--skip-summary", action="store_true", help="Skip loading additional summary stats in metadata.json")
+    parser.add_argument("--need", choices=["melt", "amp", "results", "all"], default="all", help="Only load and save the selected data sheet(s)")
 
     args = parser.parse_args()
 
@@ -320,5 +602,6 @@ if __name__ == "__main__":
             verbose=args.verbose,
             dry_run=args.dry_run,
             skip_metadata=args.skip_metadata,
-            skip_summary=args.skip_summary
+            skip_summary=args.skip_summary,
+            need=args.need
         )